@@ -1,4 +1,3 @@
-import json
 import os
 
 import boto3
@@ -10,6 +9,7 @@ from aws_lambda_powertools.event_handler.exceptions import (
 from aws_lambda_powertools.logging import correlation_paths
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from aws_lambda_powertools.utilities.validation import validate
+from codec import loads
 from powertools import logger, metrics, tracer
 from schema import SCHEMA
 
@@ -21,7 +21,7 @@ sqs_client = boto3.client("sqs")
 @tracer.capture_method
 def process() -> dict:
     if app.current_event["headers"].get("Content-Type") == "application/json":
-        return process_order_json(app.current_event.json_body)
+        return process_order_json(app.current_event.decoded_body)
     elif app.current_event["headers"].get("Content-Type") == "application/xml":
         return process_order_xml(app.current_event.body)  # Changed from json_body
     else:
@@ -46,10 +46,17 @@ def send_to_sqs(queue_url: str, message_body: str | dict, event_type: str) -> bo
 
 
 @tracer.capture_method
-def process_order_json(order: dict) -> dict:
+def process_order_json(order: str) -> dict:
     logger.info("Processing JSON order")
-    validate(event=order, schema=SCHEMA)
-    return send_to_sqs(os.environ["ORDERS_QUEUE_URL"], json.dumps(order), "json_order")
+    # Validation parses with orjson, which is looser than the consumer's exact
+    # parse (wide integers become floats) and rejects lone surrogate escapes
+    try:
+        payload = loads(order)
+    except ValueError:
+        raise BadRequestError("Invalid JSON body")
+    validate(event=payload, schema=SCHEMA)
+    # Forward the original body so the order is not serialized a second time
+    return send_to_sqs(os.environ["ORDERS_QUEUE_URL"], order, "json_order")
 
 
 @tracer.capture_method
@@ -0,0 +1,21 @@
+import json
+from decimal import Decimal
+
+import orjson
+
+
+def loads(body: str | bytes) -> dict:
+    """Parse a JSON document, numbers as int or float"""
+    return orjson.loads(body)
+
+
+def loads_order(body: str | bytes) -> dict:
+    """Parse a JSON order with every float as an exact Decimal for DynamoDB
+
+    Decimals are built from the number literals themselves, so digits beyond
+    float precision and trailing zeros are kept. Parsing with orjson and
+    converting floats afterwards can't guarantee that, and checking the literals
+    costs more than this parse (see the "orjson checked" column of
+    benchmarks/json_codec.py).
+    """
+    return json.loads(body, parse_float=Decimal)
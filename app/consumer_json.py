@@ -1,4 +1,3 @@
-import json
 import os
 from decimal import Decimal
 
@@ -10,7 +9,9 @@ from aws_lambda_powertools.utilities.batch import (
 )
 from aws_lambda_powertools.utilities.data_classes.sqs_event import SQSRecord
 from aws_lambda_powertools.utilities.typing import LambdaContext
+from codec import loads_order
 from powertools import logger, metrics, tracer
+from storage import to_item
 
 processor = BatchProcessor(event_type=EventType.SQS)
 
@@ -31,14 +32,14 @@ def float_to_decimal(obj):
 def record_handler(record: SQSRecord) -> str:
     """Process individual SQS record and return success/failure"""
     try:
-        # Parse message body as JSON and convert floats to Decimals
-        payload = json.loads(record.body, parse_float=Decimal)
+        # Parse message body as JSON with every float as a Decimal
+        payload = loads_order(record.body)
 
         # Add format information to the payload
         payload["format"] = "json"
 
         # Store in DynamoDB
-        table.put_item(Item=payload)
+        table.put_item(Item=to_item(payload))
 
         # Add your business logic here
         logger.info(f"Processing order: {payload.get('id', 'unknown')}")
@@ -11,6 +11,7 @@ from aws_lambda_powertools.utilities.batch import (
 from aws_lambda_powertools.utilities.data_classes.sqs_event import SQSRecord
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from powertools import logger, metrics, tracer
+from storage import to_item
 
 processor = BatchProcessor(event_type=EventType.SQS)
 
@@ -53,7 +54,7 @@ def record_handler(record: SQSRecord) -> str:
         payload["format"] = "xml"
 
         # Store in DynamoDB
-        table.put_item(Item=payload)
+        table.put_item(Item=to_item(payload))
 
         order_id = payload.get("id", "unknown")
         logger.info(f"Processing XML order: {order_id}")
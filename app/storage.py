@@ -0,0 +1,197 @@
+import json
+import os
+import zlib
+from decimal import Decimal
+from json.encoder import encode_basestring
+
+# Storage codec used by the consumers when writing orders to DynamoDB:
+# "verbatim" stores the order as received, "compact" shrinks the item to cut WCUs
+STORAGE_CODECS = ("verbatim", "compact")
+STORAGE_CODEC = os.environ.get("ORDERS_STORAGE_CODEC", "verbatim")
+if STORAGE_CODEC not in STORAGE_CODECS:
+    raise ValueError(
+        f"Unsupported ORDERS_STORAGE_CODEC {STORAGE_CODEC!r}, "
+        f"expected one of {', '.join(STORAGE_CODECS)}"
+    )
+
+# Version marker written on compact items. It is stored as binary, which JSON
+# and XML orders can't contain, so verbatim items are never mistaken for it.
+VERSION_ATTRIBUTE = "v"
+COMPACT_VERSION = 1
+
+# Flag written instead of shipping_address when it equals billing_address
+SAME_SHIPPING_ATTRIBUTE = "ss"
+
+# Attributes without a short name are moved into this map, so they can't
+# collide with the short names, the version marker or the flag
+EXTRA_ATTRIBUTE = "x"
+
+# id, status, customer_id and total_amount keep their names to stay queryable
+ORDER_ATTRIBUTES = {
+    "id": "id",
+    "status": "status",
+    "customer_id": "customer_id",
+    "total_amount": "total_amount",
+    "customer_email": "ce",
+    "customer_name": "cn",
+    "billing_address": "ba",
+    "shipping_address": "sa",
+    "items": "it",
+    "created_at": "ca",
+    "updated_at": "ua",
+    "payment_method": "pm",
+    "payment_id": "pi",
+    "tracking_number": "tn",
+    "notes": "no",
+    "format": "f",
+}
+
+ADDRESS_ATTRIBUTES = {
+    "street": "s",
+    "city": "c",
+    "state": "st",
+    "postal_code": "pc",
+    "country": "co",
+}
+
+ITEM_ATTRIBUTES = {
+    "product_id": "p",
+    "product_name": "n",
+    "quantity": "q",
+    "unit_price": "u",
+    "subtotal": "s",
+}
+
+
+def _invert(names: dict) -> dict:
+    return {short: long for long, short in names.items()}
+
+
+ORDER_ATTRIBUTES_REVERSE = _invert(ORDER_ATTRIBUTES)
+ADDRESS_ATTRIBUTES_REVERSE = _invert(ADDRESS_ATTRIBUTES)
+ITEM_ATTRIBUTES_REVERSE = _invert(ITEM_ATTRIBUTES)
+
+
+def _shorten(obj: dict, names: dict) -> dict:
+    """Rename known keys to their short names and nest the others"""
+    result = {}
+    extra = {}
+    for name, value in obj.items():
+        if name in names:
+            result[names[name]] = value
+        else:
+            extra[name] = value
+    if extra:
+        result[EXTRA_ATTRIBUTE] = extra
+    return result
+
+
+def _expand(obj: dict, reverse: dict) -> dict:
+    """Undo _shorten"""
+    result = {reverse[k]: v for k, v in obj.items() if k != EXTRA_ATTRIBUTE}
+    result.update(obj.get(EXTRA_ATTRIBUTE, {}))
+    return result
+
+
+def _dumps(value) -> str:
+    """Serialize DynamoDB values to JSON, writing Decimals as JSON numbers"""
+    if isinstance(value, str):
+        return encode_basestring(value)
+    if isinstance(value, bool) or value is None:
+        return json.dumps(value)
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, Decimal):
+        if not value.is_finite():
+            raise TypeError(f"Unsupported number value: {value}")
+        return str(value)
+    if isinstance(value, dict):
+        fields = (f"{encode_basestring(k)}:{_dumps(v)}" for k, v in value.items())
+        return "{" + ",".join(fields) + "}"
+    if isinstance(value, list):
+        return "[" + ",".join(_dumps(v) for v in value) + "]"
+    raise TypeError(f"Unsupported item value type: {type(value)}")
+
+
+def pack_items(items: list) -> bytes:
+    """Pack line items into a zlib compressed JSON document with short keys"""
+    packed = [
+        _shorten(item, ITEM_ATTRIBUTES) if isinstance(item, dict) else item
+        for item in items
+    ]
+    return zlib.compress(_dumps(packed).encode("utf-8"), 9)
+
+
+def unpack_items(blob) -> list:
+    """Unpack line items produced by pack_items, numbers as Decimal like DynamoDB"""
+    packed = json.loads(
+        zlib.decompress(_binary(blob)), parse_float=Decimal, parse_int=Decimal
+    )
+    return [
+        _expand(item, ITEM_ATTRIBUTES_REVERSE) if isinstance(item, dict) else item
+        for item in packed
+    ]
+
+
+def _binary(value):
+    """Unwrap boto3.dynamodb.types.Binary, returning None for non binary values"""
+    value = getattr(value, "value", value)
+    return bytes(value) if isinstance(value, (bytes, bytearray)) else None
+
+
+def is_compact(item: dict) -> bool:
+    return _binary(item.get(VERSION_ATTRIBUTE)) is not None
+
+
+def encode_item(order: dict) -> dict:
+    """Convert an order into its compact DynamoDB item representation"""
+    order = dict(order)
+    billing = order.get("billing_address")
+    shipping = order.get("shipping_address")
+    same_shipping = isinstance(billing, dict) and shipping == billing
+    if same_shipping:
+        del order["shipping_address"]
+
+    for name in ("billing_address", "shipping_address"):
+        if isinstance(order.get(name), dict):
+            order[name] = _shorten(order[name], ADDRESS_ATTRIBUTES)
+    if isinstance(order.get("items"), list):
+        order["items"] = pack_items(order["items"])
+
+    item = _shorten(order, ORDER_ATTRIBUTES)
+    item[VERSION_ATTRIBUTE] = bytes([COMPACT_VERSION])
+    if same_shipping:
+        item[SAME_SHIPPING_ATTRIBUTE] = True
+    return item
+
+
+def decode_item(item: dict) -> dict:
+    """Convert a stored DynamoDB item back into an order, whatever its codec"""
+    if not is_compact(item):
+        return item
+
+    version = _binary(item[VERSION_ATTRIBUTE])
+    if version != bytes([COMPACT_VERSION]):
+        raise ValueError(f"Unsupported order item version: {version!r}")
+
+    compact = {
+        k: v
+        for k, v in item.items()
+        if k not in (VERSION_ATTRIBUTE, SAME_SHIPPING_ATTRIBUTE)
+    }
+    order = _expand(compact, ORDER_ATTRIBUTES_REVERSE)
+    for name in ("billing_address", "shipping_address"):
+        if isinstance(order.get(name), dict):
+            order[name] = _expand(order[name], ADDRESS_ATTRIBUTES_REVERSE)
+    if _binary(order.get("items")) is not None:
+        order["items"] = unpack_items(order["items"])
+    if item.get(SAME_SHIPPING_ATTRIBUTE):
+        order["shipping_address"] = dict(order["billing_address"])
+    return order
+
+
+def to_item(order: dict) -> dict:
+    """Build the DynamoDB item for an order using the configured storage codec"""
+    if STORAGE_CODEC == "compact":
+        return encode_item(order)
+    return order
@@ -0,0 +1,118 @@
+"""Compare DynamoDB item size and WCUs per order for the verbatim and compact codecs
+
+Run from the project root:
+
+    python benchmarks/item_size.py
+"""
+
+import copy
+import json
+import math
+import os
+import sys
+import uuid
+from decimal import Decimal
+
+APP_DIR = os.path.join(os.path.dirname(__file__), "..", "app")
+EVENTS_DIR = os.path.join(os.path.dirname(__file__), "..", "events")
+sys.path.insert(0, os.path.abspath(APP_DIR))
+
+from storage import decode_item, encode_item  # noqa: E402
+
+PRODUCTS = [
+    ("Premium Coffee Maker", Decimal("199.99")),
+    ("Coffee Beans (1kg)", Decimal("29.99")),
+    ("Ceramic Pour-Over Dripper", Decimal("34.50")),
+    ("Stainless Steel Milk Frother", Decimal("49.95")),
+    ("Paper Filters (100 pack)", Decimal("6.99")),
+    ("Insulated Travel Mug 16oz", Decimal("24.00")),
+]
+
+
+def number_size(value) -> int:
+    """Approximate DynamoDB number size: one byte per two significant digits plus one"""
+    digits = str(value).lstrip("-").replace(".", "").lstrip("0") or "0"
+    return math.ceil(len(digits) / 2) + 1
+
+
+def attribute_size(value) -> int:
+    """Approximate DynamoDB storage size of an attribute value in bytes"""
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, bool) or value is None:
+        return 1
+    if isinstance(value, (int, float, Decimal)):
+        return number_size(value)
+    if isinstance(value, dict):
+        return 3 + sum(
+            len(k.encode("utf-8")) + attribute_size(v) + 1 for k, v in value.items()
+        )
+    if isinstance(value, list):
+        return 3 + sum(attribute_size(v) + 1 for v in value)
+    raise TypeError(f"Unsupported attribute type: {type(value)}")
+
+
+def item_size(item: dict) -> int:
+    return sum(len(k.encode("utf-8")) + attribute_size(v) for k, v in item.items())
+
+
+def write_capacity_units(item: dict) -> int:
+    return math.ceil(item_size(item) / 1024)
+
+
+def load_order() -> dict:
+    with open(os.path.join(EVENTS_DIR, "order.json")) as f:
+        order = json.load(f, parse_float=Decimal)
+    order["format"] = "json"
+    return order
+
+
+def build_order(base: dict, item_count: int, same_address: bool) -> dict:
+    order = copy.deepcopy(base)
+    order["id"] = str(uuid.uuid4())
+    if same_address:
+        order["shipping_address"] = dict(order["billing_address"])
+    order["items"] = []
+    for i in range(item_count):
+        name, price = PRODUCTS[i % len(PRODUCTS)]
+        quantity = i % 3 + 1
+        order["items"].append(
+            {
+                "product_id": str(uuid.uuid4()),
+                "product_name": name,
+                "quantity": quantity,
+                "unit_price": price,
+                "subtotal": price * quantity,
+            }
+        )
+    order["total_amount"] = sum(item["subtotal"] for item in order["items"])
+    return order
+
+
+def main():
+    base = load_order()
+    print(
+        f"{'items':>6} {'same addr':>9} {'verbatim B':>11} {'compact B':>10}"
+        f" {'saved':>6} {'verbatim WCU':>13} {'compact WCU':>12}"
+    )
+    for item_count in (1, 2, 5, 10, 25, 50, 100):
+        for same_address in (False, True):
+            order = build_order(base, item_count, same_address)
+            compact = encode_item(order)
+            assert decode_item(compact) == order
+
+            verbatim_size = item_size(order)
+            compact_size = item_size(compact)
+            saved = 1 - compact_size / verbatim_size
+            print(
+                f"{item_count:>6} {str(same_address):>9} {verbatim_size:>11}"
+                f" {compact_size:>10} {saved:>6.0%}"
+                f" {write_capacity_units(order):>13}"
+                f" {write_capacity_units(compact):>12}"
+            )
+
+
+if __name__ == "__main__":
+    main()
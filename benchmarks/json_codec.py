@@ -0,0 +1,111 @@
+"""Compare JSON order handling before and after forwarding the original body
+
+Only ingestion changed: it used to parse the body and dump it again for SQS,
+it now parses with orjson for validation and forwards the body unchanged. The
+consumer parse is unchanged, the same parse_float=Decimal call as before, so
+the speedup column is (ingest old + consume) / (ingest new + consume) and comes
+from ingestion alone. The "orjson checked" column times a rejected consumer
+alternative: orjson parsing, a check that every number literal is written as
+its float's shortest repr (ignoring whitespace), then converting the floats.
+
+Run from the project root:
+
+    python benchmarks/json_codec.py
+"""
+
+import json
+import os
+import sys
+import timeit
+import uuid
+from decimal import Decimal
+
+import orjson
+
+APP_DIR = os.path.join(os.path.dirname(__file__), "..", "app")
+EVENTS_DIR = os.path.join(os.path.dirname(__file__), "..", "events")
+sys.path.insert(0, os.path.abspath(APP_DIR))
+
+from codec import loads, loads_order  # noqa: E402
+
+PRODUCTS = [
+    ("Premium Coffee Maker", 199.99),
+    ("Coffee Beans (1kg)", 29.99),
+    ("Ceramic Pour-Over Dripper", 34.50),
+    ("Stainless Steel Milk Frother", 49.95),
+    ("Paper Filters (100 pack)", 6.99),
+    ("Insulated Travel Mug 16oz", 24.00),
+]
+
+
+def build_body(item_count: int) -> str:
+    with open(os.path.join(EVENTS_DIR, "order.json")) as f:
+        order = json.load(f)
+    order["items"] = []
+    total = Decimal(0)
+    for i in range(item_count):
+        name, price = PRODUCTS[i % len(PRODUCTS)]
+        quantity = i % 3 + 1
+        subtotal = Decimal(str(price)) * quantity
+        total += subtotal
+        order["items"].append(
+            {
+                "product_id": str(uuid.uuid4()),
+                "product_name": name,
+                "quantity": quantity,
+                "unit_price": price,
+                "subtotal": float(subtotal),
+            }
+        )
+    order["total_amount"] = float(total)
+    return json.dumps(order, indent=2)
+
+
+def measure(func, number: int) -> float:
+    """Best time per call in microseconds"""
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def floats_to_decimal(value):
+    """Replace every float nested in a parsed JSON value with a Decimal"""
+    entries = value.items() if type(value) is dict else enumerate(value)
+    for key, entry in entries:
+        if type(entry) is float:
+            value[key] = Decimal(repr(entry))
+        elif type(entry) is dict or type(entry) is list:
+            floats_to_decimal(entry)
+
+
+def loads_order_orjson_checked(body: str) -> dict:
+    """Consumer parse using orjson, exact only when the literal check passes"""
+    order = orjson.loads(body)
+    canonical = b"".join(orjson.dumps(order).split())
+    if canonical != b"".join(body.encode("utf-8").split()):
+        return json.loads(body, parse_float=Decimal)
+    floats_to_decimal(order)
+    return order
+
+
+def main():
+    print(
+        f"{'items':>6} {'ingest old us':>14} {'ingest new us':>14}"
+        f" {'consume us':>11} {'orjson checked us':>18} {'speedup':>8}"
+    )
+    for item_count in (1, 10, 100, 1000, 5000):
+        body = build_body(item_count)
+        number = max(1, 20000 // item_count)
+        assert loads_order_orjson_checked(body) == loads_order(body)
+
+        ingest_old = measure(lambda: json.dumps(json.loads(body)), number)
+        ingest_new = measure(lambda: loads(body), number)
+        consume = measure(lambda: loads_order(body), number)
+        checked = measure(lambda: loads_order_orjson_checked(body), number)
+        speedup = (ingest_old + consume) / (ingest_new + consume)
+        print(
+            f"{item_count:>6} {ingest_old:>14.1f} {ingest_new:>14.1f}"
+            f" {consume:>11.1f} {checked:>18.1f} {speedup:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
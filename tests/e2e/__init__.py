@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Storage helpers are imported from the app directory like the Lambda handlers do
+APP_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "app"))
+sys.path.insert(0, APP_DIR)
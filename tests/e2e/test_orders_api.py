@@ -8,6 +8,8 @@ import xml.etree.ElementTree as ET
 
 import boto3
 import requests
+from boto3.dynamodb.types import TypeDeserializer
+from storage import decode_item
 
 from .test_fixtures import TestConfig
 
@@ -77,15 +79,19 @@ class TestOrdersApi(unittest.TestCase):
                 f"Order not found in DynamoDB after multiple attempts: {order_id}"
             )
 
-        stored_order = result["Item"]
-        self.assertEqual(stored_order["id"]["S"], order_id, "Order ID mismatch")
+        # Decode the item so both verbatim and compact storage codecs are checked
+        deserializer = TypeDeserializer()
+        stored_order = decode_item(
+            {k: deserializer.deserialize(v) for k, v in result["Item"].items()}
+        )
+        self.assertEqual(stored_order["id"], order_id, "Order ID mismatch")
         self.assertEqual(
-            stored_order["customer_email"]["S"],
+            stored_order["customer_email"],
             expected_email,
             "Customer email mismatch",
         )
         self.assertEqual(
-            stored_order["format"]["S"],
+            stored_order["format"],
             expected_format,
             f"Format should be {expected_format}",
         )
@@ -0,0 +1,15 @@
+import os
+import sys
+
+# Lambda handlers import their sibling modules from the app directory
+APP_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "app"))
+sys.path.insert(0, APP_DIR)
+
+# Handlers create AWS clients and read their configuration at import time
+os.environ.setdefault("AWS_DEFAULT_REGION", "eu-west-1")
+os.environ.setdefault(
+    "ORDERS_QUEUE_URL", "https://sqs.eu-west-1.amazonaws.com/123456789012/OrderQeue"
+)
+os.environ.setdefault("ORDERS_TABLE", "Orders")
+os.environ.setdefault("POWERTOOLS_TRACE_DISABLED", "true")
+os.environ.setdefault("POWERTOOLS_METRICS_NAMESPACE", "OrderService")
@@ -0,0 +1,65 @@
+import json
+import os
+import unittest
+from unittest import mock
+
+import app
+
+
+class LambdaContext:
+    function_name = "OrderIngestionFunction"
+    memory_limit_in_mb = 256
+    invoked_function_arn = (
+        "arn:aws:lambda:eu-west-1:123456789012:function:OrderIngestionFunction"
+    )
+    aws_request_id = "c6af9ac6-7b61-11e6-9a41-93e8deadbeef"
+
+
+class TestOrderIngestion(unittest.TestCase):
+    def setUp(self):
+        file_path = os.path.join(
+            os.path.dirname(__file__), "..", "..", "events", "api_order_json.json"
+        )
+        with open(file_path, "r") as f:
+            self.event = json.load(f)
+        patcher = mock.patch.object(app, "sqs_client")
+        self.sqs_client = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_forwards_original_body(self):
+        body = self.event["body"].replace("259.97", "259.970")
+        self.event["body"] = body
+
+        response = app.handler(self.event, LambdaContext())
+
+        self.assertEqual(response["statusCode"], 200)
+        self.sqs_client.send_message.assert_called_once()
+        kwargs = self.sqs_client.send_message.call_args.kwargs
+        self.assertEqual(kwargs["MessageBody"], body)
+        self.assertEqual(
+            kwargs["MessageAttributes"]["eventType"]["StringValue"], "json_order"
+        )
+
+    def test_invalid_json_is_bad_request(self):
+        self.event["body"] = '{"customer_id": '
+
+        response = app.handler(self.event, LambdaContext())
+
+        self.assertEqual(response["statusCode"], 400)
+        self.sqs_client.send_message.assert_not_called()
+
+    def test_lone_surrogate_is_bad_request(self):
+        # Validation parses with orjson, which rejects what json.loads accepts
+        self.event["body"] = self.event["body"].replace(
+            '"notes": "', '"notes": "\\ud800', 1
+        )
+        self.assertEqual(json.loads(self.event["body"])["notes"][0], "\ud800")
+
+        response = app.handler(self.event, LambdaContext())
+
+        self.assertEqual(response["statusCode"], 400)
+        self.sqs_client.send_message.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import json
+import os
+import unittest
+from decimal import Decimal
+
+from codec import loads_order
+
+
+class TestJsonCodec(unittest.TestCase):
+    def setUp(self):
+        file_path = os.path.join(
+            os.path.dirname(__file__), "..", "..", "events", "order.json"
+        )
+        with open(file_path, "r") as f:
+            self.body = f.read()
+
+    def test_monetary_fields_are_exact_decimals(self):
+        order = loads_order(self.body)
+        self.assertEqual(str(order["total_amount"]), "259.97")
+        self.assertEqual(str(order["items"][1]["unit_price"]), "29.99")
+        self.assertEqual(str(order["items"][1]["subtotal"]), "59.98")
+        self.assertEqual(order["items"][1]["quantity"], 2)
+
+    def test_float_quantity_is_decimal(self):
+        order = json.loads(self.body)
+        order["items"][0]["quantity"] = 2.0
+        parsed = loads_order(json.dumps(order))
+        self.assertEqual(str(parsed["items"][0]["quantity"]), "2.0")
+
+    def test_extra_float_field_is_decimal(self):
+        order = loads_order('{"total_amount": 10, "discount_rate": 0.15}')
+        self.assertEqual(order["discount_rate"], Decimal("0.15"))
+
+    def test_long_amounts_keep_every_digit(self):
+        order = loads_order(
+            '{"total_amount": 12345678901234.567,'
+            ' "items": [{"unit_price": 0.1000000000000000055511151231257827}]}'
+        )
+        self.assertEqual(str(order["total_amount"]), "12345678901234.567")
+        self.assertEqual(
+            str(order["items"][0]["unit_price"]),
+            "0.1000000000000000055511151231257827",
+        )
+
+    def test_large_integers_stay_exact(self):
+        order = loads_order('{"total_amount": 123456789012345678901}')
+        self.assertEqual(order["total_amount"], 123456789012345678901)
+
+    def test_trailing_zeros_are_kept(self):
+        order = loads_order('{"items": [{"unit_price": 34.50}]}')
+        self.assertEqual(str(order["items"][0]["unit_price"]), "34.50")
+
+    def test_invalid_json_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            loads_order("{")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import json
+import os
+import unittest
+from unittest import mock
+
+from aws_lambda_powertools.utilities.data_classes.sqs_event import SQSRecord
+from boto3.dynamodb.types import TypeSerializer
+
+import consumer_json
+
+
+class TestJsonConsumer(unittest.TestCase):
+    def setUp(self):
+        file_path = os.path.join(
+            os.path.dirname(__file__), "..", "..", "events", "order.json"
+        )
+        with open(file_path, "r") as f:
+            self.order = json.load(f)
+        patcher = mock.patch.object(consumer_json, "table")
+        self.table = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _store(self, order: dict) -> dict:
+        """Run the record handler and return the item written to DynamoDB"""
+        record = SQSRecord({"messageId": "1", "body": json.dumps(order)})
+        consumer_json.record_handler(record)
+        item = self.table.put_item.call_args.kwargs["Item"]
+        # boto3 rejects floats while serializing the item
+        TypeSerializer().serialize(item)
+        return item
+
+    def test_stores_order(self):
+        item = self._store(self.order)
+        self.assertEqual(item["format"], "json")
+        self.assertEqual(str(item["total_amount"]), "259.97")
+
+    def test_float_quantity_is_stored(self):
+        self.order["items"][0]["quantity"] = 1.0
+        item = self._store(self.order)
+        self.assertEqual(str(item["items"][0]["quantity"]), "1.0")
+
+    def test_extra_float_field_is_stored(self):
+        self.order["discount_rate"] = 0.15
+        item = self._store(self.order)
+        self.assertEqual(str(item["discount_rate"]), "0.15")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import importlib
+import json
+import os
+import unittest
+from decimal import Decimal
+from unittest import mock
+
+from aws_lambda_powertools.utilities.data_classes.sqs_event import SQSRecord
+
+import consumer_json
+import storage
+from storage import (
+    COMPACT_VERSION,
+    VERSION_ATTRIBUTE,
+    decode_item,
+    encode_item,
+    is_compact,
+    to_item,
+)
+
+
+class TestStorageCodec(unittest.TestCase):
+    def setUp(self):
+        file_path = os.path.join(
+            os.path.dirname(__file__), "..", "..", "events", "order.json"
+        )
+        with open(file_path, "r") as f:
+            self.body = f.read()
+        self.order = json.loads(self.body, parse_float=Decimal)
+        self.order["format"] = "json"
+
+    def test_round_trip(self):
+        item = encode_item(self.order)
+        self.assertEqual(item[VERSION_ATTRIBUTE], bytes([COMPACT_VERSION]))
+        self.assertIsInstance(item["it"], bytes)
+        self.assertEqual(decode_item(item), self.order)
+
+    def test_queryable_attributes_stay_top_level(self):
+        item = encode_item(self.order)
+        for name in ("id", "status", "customer_id", "total_amount"):
+            self.assertEqual(item[name], self.order[name])
+
+    def test_shipping_address_dedup(self):
+        self.order["shipping_address"] = dict(self.order["billing_address"])
+        item = encode_item(self.order)
+        self.assertNotIn("sa", item)
+        self.assertTrue(item["ss"])
+        self.assertEqual(decode_item(item), self.order)
+
+    def test_missing_shipping_address_stays_missing(self):
+        del self.order["shipping_address"]
+        self.assertEqual(decode_item(encode_item(self.order)), self.order)
+
+    def test_none_values_are_kept(self):
+        self.order["shipping_address"] = None
+        self.order["notes"] = None
+        item = encode_item(self.order)
+        self.assertIsNone(item["sa"])
+        self.assertEqual(decode_item(item), self.order)
+
+    def test_item_numbers_decode_as_decimal(self):
+        self.order["items"][0]["discount"] = Decimal("5.00")
+        self.order["items"][0]["options"] = {"grind": "fine", "weight": Decimal("1.5")}
+        items = decode_item(encode_item(self.order))["items"]
+        self.assertEqual(str(items[1]["unit_price"]), "29.99")
+        self.assertIsInstance(items[1]["quantity"], Decimal)
+        self.assertEqual(str(items[0]["discount"]), "5.00")
+        self.assertEqual(items[0]["options"]["weight"], Decimal("1.5"))
+
+    def test_colliding_attribute_names(self):
+        self.order["v"] = "note"
+        self.order["ce"] = "other"
+        self.order["x"] = {"it": 1}
+        self.order["billing_address"]["s"] = "suite 5"
+        self.order["items"][0]["s"] = "size M"
+        item = encode_item(self.order)
+        self.assertEqual(item[VERSION_ATTRIBUTE], bytes([COMPACT_VERSION]))
+        self.assertEqual(decode_item(item), self.order)
+
+    def test_verbatim_item_passes_through(self):
+        self.order["v"] = Decimal(1)
+        self.assertFalse(is_compact(self.order))
+        self.assertIs(decode_item(self.order), self.order)
+
+    def test_unknown_version_is_rejected(self):
+        item = encode_item(self.order)
+        item[VERSION_ATTRIBUTE] = bytes([COMPACT_VERSION + 1])
+        with self.assertRaises(ValueError):
+            decode_item(item)
+
+    def test_to_item_uses_configured_codec(self):
+        self.assertIs(to_item(self.order), self.order)
+        with mock.patch.object(storage, "STORAGE_CODEC", "compact"):
+            self.assertTrue(is_compact(to_item(self.order)))
+
+    def test_unknown_codec_is_rejected(self):
+        try:
+            with mock.patch.dict(os.environ, {"ORDERS_STORAGE_CODEC": "compakt"}):
+                with self.assertRaises(ValueError):
+                    importlib.reload(storage)
+        finally:
+            importlib.reload(storage)
+
+    def test_json_consumer_uses_configured_codec(self):
+        record = SQSRecord({"messageId": "1", "body": self.body})
+        with mock.patch.object(consumer_json, "table") as table:
+            with mock.patch.object(storage, "STORAGE_CODEC", "compact"):
+                consumer_json.record_handler(record)
+        item = table.put_item.call_args.kwargs["Item"]
+        self.assertTrue(is_compact(item))
+        self.assertEqual(decode_item(item), self.order)
+
+
+if __name__ == "__main__":
+    unittest.main()